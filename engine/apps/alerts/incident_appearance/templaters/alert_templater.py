@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 from django.conf import settings
+from django.utils.functional import cached_property
 
 from apps.base.messaging import get_messaging_backend_from_id
 from apps.slack.slack_formatter import SlackFormatter
@@ -63,6 +64,10 @@ class TemplateLoader:
         return getattr(alert_receive_channel, f"INTEGRATION_TO_DEFAULT_{attr.upper()}_TEMPLATE", {})
 
 
+# TemplateLoader is stateless, so one shared instance serves all templaters
+template_loader = TemplateLoader()
+
+
 @dataclass
 class TemplatedAlert:
     title: str = None
@@ -74,11 +79,15 @@ class TemplatedAlert:
 class AlertTemplater(ABC):
     def __init__(self, alert):
         self.alert = alert
-        self.slack_formatter = SlackFormatter(alert.group.channel.organization)
-        self.template_manager = TemplateLoader()
+        self.template_manager = template_loader
         self.incident_id = self.alert.group.inside_organization_number
         self.link = self.alert.group.web_link
 
+    @cached_property
+    def slack_formatter(self):
+        # built lazily: only templaters whose _postformat reformats slack markup use it
+        return SlackFormatter(self.alert.group.channel.organization)
+
     def render(self):
         """
         Rendering pipeline:
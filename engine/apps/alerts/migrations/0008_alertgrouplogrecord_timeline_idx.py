@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alerts', '0007_populate_web_title_cache'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alertgrouplogrecord',
+            index=models.Index(fields=['alert_group_id', 'created_at'], name='alerts_log_record_timeline_idx'),
+        ),
+    ]
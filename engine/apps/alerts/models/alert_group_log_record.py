@@ -7,6 +7,7 @@ from django.db import models
 from django.db.models import JSONField
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils.functional import cached_property
 from rest_framework.fields import DateTimeField
 
 from apps.alerts.tasks import send_update_log_report_signal
@@ -192,6 +193,12 @@ class AlertGroupLogRecord(models.Model):
 
     STEP_SPECIFIC_INFO_KEYS = ["schedule_name", "custom_button_name", "usergroup_handle"]
 
+    class Meta:
+        # log report rendering filters by alert_group and orders by created_at
+        indexes = [
+            models.Index(fields=["alert_group_id", "created_at"], name="alerts_log_record_timeline_idx"),
+        ]
+
     def render_log_line_json(self):
         time = humanize.naturaldelta(self.alert_group.started_at - self.created_at)
         created_at = DateTimeField().to_representation(self.created_at)
@@ -533,7 +540,8 @@ class AlertGroupLogRecord(models.Model):
                     result += f"failed to notify User Group{usergroup_handle_text} in Slack"
         return result
 
-    def get_step_specific_info(self):
+    @cached_property
+    def _parsed_step_specific_info(self):
         step_specific_info = None
         # in some cases step_specific_info was saved with using json.dumps
         if self.step_specific_info is not None:
@@ -543,6 +551,10 @@ class AlertGroupLogRecord(models.Model):
                 step_specific_info = json.loads(self.step_specific_info)
         return step_specific_info
 
+    def get_step_specific_info(self):
+        # cached on the instance, so repeated log line renders don't re-parse the json
+        return self._parsed_step_specific_info
+
 
 @receiver(post_save, sender=AlertGroupLogRecord)
 def listen_for_alertgrouplogrecord(sender, instance, created, *args, **kwargs):
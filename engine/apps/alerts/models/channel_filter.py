@@ -6,6 +6,7 @@ from django.apps import apps
 from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import models
+from django.utils.functional import cached_property
 from ordered_model.models import OrderedModel
 
 from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
@@ -105,22 +106,34 @@ class ChannelFilter(OrderedModel):
 
         filters = cls.objects.filter(alert_receive_channel=alert_receive_channel)
 
+        # serialize the payload once instead of once per filter
+        raw_request_data_str = json.dumps(raw_request_data)
         satisfied_filter = None
         for _filter in filters:
-            if satisfied_filter is None and _filter.is_satisfying(raw_request_data, title, message):
+            if _filter.is_satisfying(raw_request_data_str, title, message):
                 satisfied_filter = _filter
+                break
 
         return satisfied_filter
 
-    def is_satisfying(self, raw_request_data, title, message=None):
-        return self.is_default or self.check_filter(json.dumps(raw_request_data)) or self.check_filter(str(title))
+    def is_satisfying(self, raw_request_data_str, title, message=None):
+        return self.is_default or self.check_filter(raw_request_data_str) or self.check_filter(str(title))
 
-    def check_filter(self, value):
+    @cached_property
+    def compiled_filtering_term(self):
         try:
-            return re.search(self.filtering_term, value)
+            return re.compile(self.filtering_term)
         except re.error:
             logger.error(f"channel_filter={self.id} failed to parse regex={self.filtering_term}")
+            return None
+        except TypeError:
+            # the default route has no filtering term
+            return None
+
+    def check_filter(self, value):
+        if self.compiled_filtering_term is None:
             return False
+        return self.compiled_filtering_term.search(value)
 
     @property
     def slack_channel_id_or_general_log_id(self):
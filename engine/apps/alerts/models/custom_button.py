@@ -1,17 +1,19 @@
 import json
 import logging
 import re
+from base64 import b64encode
 from json import JSONDecodeError
+from json.encoder import encode_basestring_ascii
 
 from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import models
 from django.db.models import F
 from django.utils import timezone
-from requests.auth import HTTPBasicAuth
+from django.utils.functional import cached_property
 
 from common.jinja_templater import apply_jinja_template
-from common.jinja_templater.apply_jinja_template import JinjaTemplateError, JinjaTemplateWarning
+from common.jinja_templater.apply_jinja_template import JinjaTemplateError, JinjaTemplateWarning, compile_jinja_template
 from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
 
 logger = logging.getLogger(__name__)
@@ -23,7 +25,9 @@ def generate_public_primary_key_for_custom_button():
     new_public_primary_key = generate_public_primary_key(prefix)
 
     failure_counter = 0
-    while CustomButton.objects.filter(public_primary_key=new_public_primary_key).exists():
+    # check against objects_with_deleted: soft-deleted buttons keep their public_primary_key,
+    # and the unfiltered manager lets the EXISTS query be answered from the unique index alone
+    while CustomButton.objects_with_deleted.filter(public_primary_key=new_public_primary_key).exists():
         new_public_primary_key = increase_public_primary_key_length(
             failure_counter=failure_counter, prefix=prefix, model_name="CustomButton"
         )
@@ -83,6 +87,20 @@ class CustomButton(models.Model):
     def __str__(self):
         return str(self.name)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # warm the shared compiled-template cache at load time, so the first send in a fresh
+        # worker doesn't pay jinja compilation inside the task; a no-op when already cached.
+        # the __dict__ check keeps deferred loads from triggering an extra query here
+        if instance.__dict__.get("data"):
+            try:
+                compile_jinja_template(instance.data)
+            except Exception:
+                # invalid templates surface with a fallback message at render time
+                pass
+        return instance
+
     def delete(self):
         logger.info(f"Soft delete of custom button {self}")
         self.escalation_policies.all().delete()
@@ -96,28 +114,40 @@ class CustomButton(models.Model):
     def hard_delete(self):
         super().delete()
 
+    @cached_property
+    def basic_auth_header_value(self):
+        # same value HTTPBasicAuth would compute per request (requests encodes credentials as latin1)
+        return "Basic " + b64encode(f"{self.user}:{self.password}".encode("latin1")).decode("ascii")
+
     def build_post_kwargs(self, alert):
         post_kwargs = {}
-        if self.user and self.password:
-            post_kwargs["auth"] = HTTPBasicAuth(self.user, self.password)
         if self.authorization_header:
             post_kwargs["headers"] = {"Authorization": self.authorization_header}
+        # basic auth last: it took precedence over authorization_header when both were set,
+        # since requests applied the auth kwarg on top of the headers
+        if self.user and self.password:
+            post_kwargs["headers"] = {"Authorization": self.basic_auth_header_value}
         if self.forward_whole_payload:
             post_kwargs["json"] = alert.raw_request_data
         elif self.data:
+            # escaping recursively copies the whole payload, skip it when the template never uses it
+            if "alert_payload" in self.data:
+                alert_payload = self._escape_alert_payload(alert.raw_request_data)
+            else:
+                alert_payload = None
             try:
                 rendered_data = apply_jinja_template(
                     self.data,
-                    alert_payload=self._escape_alert_payload(alert.raw_request_data),
+                    alert_payload=alert_payload,
                     alert_group_id=alert.group.public_primary_key,
                 )
             except (JinjaTemplateError, JinjaTemplateWarning) as e:
                 post_kwargs["json"] = {"error": e.fallback_message}
-
-            try:
-                post_kwargs["json"] = json.loads(rendered_data)
-            except JSONDecodeError:
-                post_kwargs["data"] = rendered_data
+            else:
+                try:
+                    post_kwargs["json"] = json.loads(rendered_data)
+                except JSONDecodeError:
+                    post_kwargs["data"] = rendered_data
         return post_kwargs
 
     def _escape_alert_payload(self, payload: dict):
@@ -138,10 +168,11 @@ class CustomButton(models.Model):
     def _escape_string(self, string: str):
         """
         Escapes string to use in json.loads() method.
-        json.dumps is the simples way to escape all special characters in string.
-        First and last chars are quotes from json.dumps(), we don't need them, only escaping.
+        encode_basestring_ascii is what json.dumps uses for strings, without the rest
+        of the encoder machinery, which matters since we call it for every string node
+        of the payload. First and last chars are quotes, we don't need them, only escaping.
         """
-        return json.dumps(string)[1:-1]
+        return encode_basestring_ascii(string)[1:-1]
 
     # Insight logs
     @property
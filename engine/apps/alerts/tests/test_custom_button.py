@@ -61,3 +61,29 @@ def test_escaping_payload_with_single_quote_in_string(
     )
 
     custom_button.build_post_kwargs(alert)
+
+
+@pytest.mark.django_db
+def test_template_error_returns_error_payload(
+    make_organization,
+    make_custom_action,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+):
+
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+
+    alert = make_alert(alert_group=alert_group, raw_request_data={"text": "Hello world"})
+
+    custom_button = make_custom_action(
+        name="github_button",
+        webhook="https://github.com/",
+        data='{"data" : "{{ alert_payload.text + 25 }}"}',
+        organization=organization,
+    )
+
+    post_kwargs = custom_button.build_post_kwargs(alert)
+    assert "error" in post_kwargs["json"]
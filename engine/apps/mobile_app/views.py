@@ -1,3 +1,4 @@
+from django.db import transaction
 from push_notifications.api.rest_framework import APNSDeviceAuthorizedViewSet as BaseAPNSDeviceAuthorizedViewSet
 from push_notifications.api.rest_framework import GCMDeviceAuthorizedViewSet, GCMDeviceSerializer
 from rest_framework import status
@@ -46,14 +47,11 @@ class MobileAppAuthTokenAPIView(APIView):
         return Response(response, status=status.HTTP_200_OK)
 
     def post(self, request):
-        # If token already exists revoke it
-        try:
-            token = MobileAppAuthToken.objects.get(user=self.request.user)
-            token.delete()
-        except MobileAppAuthToken.DoesNotExist:
-            pass
-
-        instance, token = MobileAppAuthToken.create_auth_token(self.request.user, self.request.user.organization)
+        # Revoke the existing token (if any) and issue the new one in a single transaction,
+        # so two round-trips can't race and a failure can't leave the user without a token
+        with transaction.atomic():
+            MobileAppAuthToken.objects.filter(user=self.request.user).delete()
+            instance, token = MobileAppAuthToken.create_auth_token(self.request.user, self.request.user.organization)
         data = {"id": instance.pk, "token": token, "created_at": instance.created_at}
         return Response(data, status=status.HTTP_201_CREATED)
 
@@ -24,6 +24,18 @@ class SlackActionRecord(models.Model):
     payload = models.TextField(null=True, default=None)
     datetime = models.DateTimeField(auto_now_add=True)
 
+    PAYLOAD_MAX_LENGTH = 10000
+
+    def save(self, *args, **kwargs):
+        # Interaction payloads can carry tens of kilobytes of message blocks.
+        # They are only kept for debugging, so store a bounded prefix instead of the full document.
+        if self.payload is not None:
+            if not isinstance(self.payload, str):
+                self.payload = str(self.payload)
+            if len(self.payload) > self.PAYLOAD_MAX_LENGTH:
+                self.payload = self.payload[: self.PAYLOAD_MAX_LENGTH]
+        super().save(*args, **kwargs)
+
     @staticmethod
     def filter_only_incident_routine(queryset):
         return queryset.filter(step__in=SlackActionRecord.ON_CALL_ROUTINE)
@@ -69,7 +69,12 @@ def on_alert_group_action_triggered_async(log_record_id):
 
     logger.debug(f"SLACK representative: get log record {log_record_id}")
 
-    log_record = AlertGroupLogRecord.objects.get(pk=log_record_id)
+    log_record = AlertGroupLogRecord.objects.select_related(
+        "alert_group",
+        "alert_group__channel",
+        "alert_group__channel__organization",
+        "alert_group__channel__organization__slack_team_identity",
+    ).get(pk=log_record_id)
     alert_group_id = log_record.alert_group_id
     logger.debug(f"Start on_alert_group_action_triggered for alert_group {alert_group_id}, log record {log_record_id}")
     instance = AlertGroupSlackRepresentative(log_record)
@@ -590,9 +590,9 @@ class CustomButtonProcessStep(
         if self.check_alert_is_unarchived(slack_team_identity, payload, alert_group):
             custom_button_pk = payload["actions"][0]["name"].split("_")[1]
             alert_group_pk = payload["actions"][0]["name"].split("_")[2]
-            try:
-                CustomButtom.objects.get(pk=custom_button_pk)
-            except CustomButtom.DoesNotExist:
+            # existence check only: don't pull the whole row (data template, credentials)
+            # just to discard it, the task re-fetches the button itself
+            if not CustomButtom.objects.filter(pk=custom_button_pk).exists():
                 warning_text = "Oops! This button was deleted"
                 self.open_warning_window(payload, warning_text=warning_text)
                 self._update_slack_message(alert_group)
@@ -83,7 +83,11 @@ class AlertGroupTelegramRepresentative(AlertGroupAbstractRepresentative):
         logger.info(f"AlertGroupTelegramRepresentative ACTION SIGNAL, log record {log_record}")
 
         if not isinstance(log_record, AlertGroupLogRecord):
-            log_record = AlertGroupLogRecord.objects.get(pk=log_record)
+            log_record = AlertGroupLogRecord.objects.select_related(
+                "alert_group",
+                "alert_group__channel",
+                "alert_group__channel__organization",
+            ).get(pk=log_record)
 
         instance = cls(log_record)
         if instance.is_applicable():
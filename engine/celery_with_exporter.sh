@@ -32,6 +32,11 @@ CELERY_ARGS=(
   "--max-tasks-per-child=$CELERY_WORKER_MAX_TASKS_PER_CHILD"
   "-Q" "$CELERY_WORKER_QUEUE"
 )
+# I/O-bound queues (e.g. webhook) benefit from a thread pool with high concurrency,
+# since tasks there mostly wait on outgoing HTTP instead of using CPU.
+if [ -n "$CELERY_WORKER_POOL" ]; then
+  CELERY_ARGS+=("--pool=$CELERY_WORKER_POOL")
+fi
 if [[ $CELERY_WORKER_BEAT_ENABLED = True ]]; then
   CELERY_ARGS+=("--beat")
 fi
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 from django.conf import settings
 from jinja2 import TemplateAssertionError, TemplateSyntaxError, UndefinedError
@@ -9,6 +10,17 @@ from .jinja_template_env import jinja_template_env
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def compile_jinja_template(template):
+    """
+    Compile a template string once and reuse the compiled Template across renders.
+
+    Templates are immutable between edits (integration templates, custom button data, etc.),
+    so caching the compiled object skips jinja's lexer/parser/codegen on every render.
+    """
+    return jinja_template_env.from_string(template)
+
+
 class JinjaTemplateError(Exception):
     def __init__(self, fallback_message):
         self.fallback_message = f"Template Error: {fallback_message}"
@@ -26,7 +38,7 @@ def apply_jinja_template(template, payload=None, result_length_limit=settings.JI
         )
 
     try:
-        compiled_template = jinja_template_env.from_string(template)
+        compiled_template = compile_jinja_template(template)
         result = compiled_template.render(payload=payload, **kwargs)
     except SecurityError as e:
         logger.warning(f"SecurityError process template={template} payload={payload}")
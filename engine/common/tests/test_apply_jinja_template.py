@@ -63,3 +63,10 @@ def test_apply_jinja_template_result_truncate():
     result = apply_jinja_template("{{ payload.value }}", payload)
     # Length == Limit + 2 to account for '..' appended to end
     assert len(result) == settings.JINJA_RESULT_MAX_LENGTH + 2
+
+
+def test_compile_jinja_template_is_cached():
+    from common.jinja_templater.apply_jinja_template import compile_jinja_template
+
+    template = "{{ payload.name }}"
+    assert compile_jinja_template(template) is compile_jinja_template(template)
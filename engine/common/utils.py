@@ -142,7 +142,8 @@ def isoformat_with_tz_suffix(value):
 
 
 def is_string_with_visible_characters(string):
-    return type(string) == str and not string.isspace() and not string == ""
+    # cheapest checks first: the truthiness test rejects "" before isspace() has to scan
+    return type(string) is str and bool(string) and not string.isspace()
 
 
 def str_or_backup(string, backup):
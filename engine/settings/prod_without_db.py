@@ -45,7 +45,6 @@ SECURE_HSTS_SECONDS = 360000
 
 CELERY_TASK_ROUTES = {
     # DEFAULT
-    "apps.alerts.tasks.call_ack_url.call_ack_url": {"queue": "default"},
     "apps.alerts.tasks.cache_alert_group_for_web.cache_alert_group_for_web": {"queue": "default"},
     "apps.alerts.tasks.cache_alert_group_for_web.schedule_cache_for_alert_group": {"queue": "default"},
     "apps.alerts.tasks.create_contact_points_for_datasource.create_contact_points_for_datasource": {"queue": "default"},
@@ -146,6 +145,7 @@ CELERY_TASK_ROUTES = {
     "apps.telegram.tasks.send_link_to_channel_message_or_fallback_to_full_incident": {"queue": "telegram"},
     "apps.telegram.tasks.send_log_and_actions_message": {"queue": "telegram"},
     # WEBHOOK
+    "apps.alerts.tasks.call_ack_url.call_ack_url": {"queue": "webhook"},
     "apps.alerts.tasks.custom_button_result.custom_button_result": {"queue": "webhook"},
 }
 